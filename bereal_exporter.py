@@ -1,20 +1,93 @@
 import argparse
 import json
 import os
+import sys
 import glob
-from datetime import datetime as dt
-from shutil import copy2 as cp
-from PIL import Image, ImageDraw
-import pytz
+import mmap
+import tempfile
+from datetime import datetime as dt, timezone
+from shutil import copyfileobj
+from PIL import Image, ImageDraw, features, __version__ as PIL_VERSION
+from zoneinfo import ZoneInfo
 from timezonefinder import TimezoneFinder
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import partial
+from functools import partial, lru_cache
+from itertools import islice
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 import logging
+import threading
+import queue
+from operator import itemgetter
+from typing import Iterable
+from contextlib import contextmanager, nullcontext
 
 from exiftool import ExifToolHelper as et
 
+try:
+    import ijson  # Optional, streams large JSON exports instead of loading them at once
+except ImportError:
+    ijson = None
+
+# ijson's pure-Python backend is several times slower than loading the whole file,
+# only stream when one of its compiled (yajl) backends is available
+STREAM_JSON = ijson is not None and ijson.backend != "python"
+
+try:
+    import orjson  # Optional, faster than json when the whole file has to be loaded
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # Not available on Windows
+except ImportError:
+    fcntl = None
+
+# Errors raised while reading the export's JSON files (orjson's error subclasses json's)
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# Timezone used for BeReals without a location
+DEFAULT_TIMEZONE = ZoneInfo("America/New_York")
+
+# Minimum seconds between progress bar redraws, thousands of fast items don't need a redraw each.
+# The export bars are passed disable=None, which turns them off when not writing to a terminal.
+PROGRESS_MININTERVAL = 0.5
+# The per-item export bars also wait for about 1% of the items between redraw checks
+PROGRESS_STEPS = 100
+
+# Degrees an existing file's GPS position may differ by and still count as up to date (about 10 m),
+# EXIF stores it as rationals that don't round-trip exactly
+GPS_MATCH_TOLERANCE = 1e-4
+
+# Buffer size for copies the kernel can't do, 1 MiB is faster than shutil's default for photos
+COPY_BUFFER_SIZE = 1 << 20
+
+# Linux ioctl that makes a file share the data blocks of another one (reflink, Btrfs/XFS)
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl and sys.platform.startswith("linux") else None
+
+# Number of exported images tagged together with one ExifTool command
+TAG_BATCH_SIZE = 128
+
+# Upper bound on persistent ExifTool processes, tag writes are short and don't need one per worker
+MAX_EXIF_PROCESSES = 4
+
+# ExifTool parameters for tagging exported images, composites, the reduced fallback tags
+# and JPEG conversions. -fast skips scanning for trailers, only DateTimeOriginal and GPS tags are ever written
+IMG_TAG_PARAMS = ("-overwrite_original", "-m", "-q", "-overwrite_original_in_place", "-fast")
+COMPOSITE_TAG_PARAMS = ("-P", "-overwrite_original", "-m", "-fast")
+FALLBACK_TAG_PARAMS = ("-overwrite_original", "-m", "-q", "-fast")
+JPEG_TAG_PARAMS = ("-overwrite_original", "-fast")
+
+# Folders of the BeReal export holding the images, in the order they're searched
+PHOTO_FOLDERS = ("Photos/post", "Photos/bereal", "Photos/realmoji")
+
+# Timestamp formats get_datetime_from_str falls back to when fromisoformat can't parse a time
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # With microseconds
+    "%Y-%m-%dT%H:%M:%S.000Z",  # Without microseconds
+    "%Y-%m-%dT%H:%M:%SZ"       # No milliseconds at all
+)
+
 
 def init_parser() -> argparse.Namespace:
     """
@@ -62,8 +135,8 @@ def init_parser() -> argparse.Namespace:
         "--max-workers",
         dest="max_workers",
         type=int,
-        default=4,
-        help="Maximum number of parallel workers (default 4)",
+        default=os.cpu_count() or 4,
+        help="Maximum number of parallel workers (default: number of CPUs)",
     )
     parser.add_argument(
         "--no-memories",
@@ -130,6 +203,92 @@ def init_parser() -> argparse.Namespace:
     return args
 
 
+def load_json(f):
+    """
+    Loads a whole JSON file (opened in binary mode), with orjson if available.
+    orjson parses straight from a memory map of the file.
+    """
+    if orjson:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return orjson.loads(f.read())  # Empty or not mappable
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+    return json.load(f)
+
+
+def iter_json_items(f) -> Iterable[dict]:
+    """
+    Iterates over the items of a JSON file holding a top-level array (file opened in binary mode).
+    Items are streamed with ijson when it has a compiled backend, otherwise the whole file is loaded.
+    """
+    if STREAM_JSON:
+        return ijson.items(f, "item", use_float=True)
+    return iter(load_json(f))
+
+
+def fast_copy(src: str, dst: str):
+    """
+    Copies a file in the kernel, so the data never passes through userspace. Tries a reflink
+    (FICLONE) first, on Btrfs/XFS the copy then shares the source's data blocks until ExifTool
+    rewrites it, then copy_file_range and then sendfile.
+    Falls back to a buffered copy where none of them works (e.g. across some filesystems).
+    Only the data is copied, the source's timestamps and permissions aren't carried over:
+    tagging rewrites the file anyway, and a fresh mtime is what marks it up to date for re-runs.
+    The copy is written next to dst and renamed into place once complete, so a run that is
+    killed mid-copy never leaves a truncated dst that re-runs would take for up to date.
+    """
+    part_path = dst + ".part"
+    try:
+        with open(src, "rb") as fsrc, open(part_path, "wb") as fdst:
+            _copy_file_data(fsrc, fdst)
+        os.replace(part_path, dst)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_file_data(fsrc, fdst):
+    """
+    Copies the data of fsrc into fdst (both opened in binary mode) for fast_copy.
+    """
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    if FICLONE:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return
+        except OSError:
+            # EOPNOTSUPP/EXDEV/EINVAL, no reflinks here, nothing was written yet
+            pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                pass
+            return
+        except OSError:
+            # EXDEV/ENOSYS/EINVAL, not supported for these files, start over
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+
+    if hasattr(os, "sendfile"):
+        try:
+            while os.sendfile(dst_fd, src_fd, None, 1 << 30):
+                pass
+            return
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+
+    copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
 class BeRealExporter:
     def __init__(self, args: argparse.Namespace):
         self.time_span = self.init_time_span(args)
@@ -147,10 +306,158 @@ class BeRealExporter:
             self.logger = logging.getLogger(__name__)
         else:
             self.logger = None
+
+        # Verbose messages are written by a logger thread, so workers never wait on the terminal
+        self._log_queue = queue.Queue()
+        # Cleared while the user is prompted, the logger thread holds messages back until it's set
+        self._log_open = threading.Event()
+        self._log_open.set()
+        if self.verbose and self.logger:
+            threading.Thread(target=self._write_log, name="verbose-log", daemon=True).start()
+        self.log_pillow_build()
         
         # Find the BeReal export folder inside input
         self.bereal_path = self.find_bereal_export_folder()
 
+        # Files in the Photos folders, scanned once instead of stat'ing every candidate path.
+        # Keyed by folder, then filename, to the file's full path.
+        self._photo_index = {}
+        for folder in PHOTO_FOLDERS:
+            folder_path = os.path.join(self.bereal_path, folder)
+            if os.path.isdir(folder_path):
+                with os.scandir(folder_path) as entries:
+                    self._photo_index[folder] = {entry.name: entry.path for entry in entries if entry.is_file()}
+
+        # Pool of persistent ExifTool processes (stay_open) that workers borrow to tag in parallel.
+        # Started here on the main thread: exiftool is bound to the lifetime of the
+        # thread that spawns it, so starting it inside a worker would kill it with the pool.
+        self._exif_tools = []
+        self._exif_pool = queue.LifoQueue()
+        # Processes found dead while others were still alive, restarted by refill_exif_pool
+        self._dead_exif_tools = []
+        self._exif_lock = threading.Lock()
+        for _ in range(max(1, min(self.max_workers, MAX_EXIF_PROCESSES))):
+            try:
+                self._exif_pool.put(self.start_exif_tool())
+            except Exception as e:
+                print(f"Could not start ExifTool: {e}")
+                break
+
+        # Timezone lookups cached on a ~1 km grid, BeReals cluster around a few places
+        self._timezone_finder = None
+        self._timezone_cache = {}
+        self._timezone_lock = threading.Lock()
+
+        # Composites are CPU-bound, they get their own pool so they overlap with copying and tagging
+        self._composite_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # Rounded-corner masks for composites, keyed by (size, radius)
+        self._mask_cache = {}
+
+        # Tags of exported images waiting to be written in one batch
+        self._tag_batch = []
+        self._tag_batch_lock = threading.Lock()
+
+        # Output folders already created, so exporting an image doesn't call makedirs every time
+        self._created_dirs = set()
+
+        # DateTimeOriginal and GPS position of files already in the output folder being exported, by path
+        self._existing_exif = {}
+        # Normalized paths of the files in that folder when it was scanned
+        self._existing_files = set()
+        self._existing_files_lock = threading.Lock()
+
+        # Files skipped because a previous run already exported them
+        self._skipped_count = 0
+        self._skipped_lock = threading.Lock()
+
+    def start_exif_tool(self) -> et:
+        """
+        Starts a persistent ExifTool process and keeps track of it for close().
+        Keeping processes open avoids paying the Perl startup cost for every image.
+        """
+        exif_tool = et(executable=self.exiftool_path) if self.exiftool_path else et()
+        exif_tool.run()
+        with self._exif_lock:
+            self._exif_tools.append(exif_tool)
+        return exif_tool
+
+    def refill_exif_pool(self):
+        """
+        Replaces the ExifTool processes that died since the last call. Only call this from
+        the main thread, a process started from a worker dies with it (see __init__).
+        """
+        with self._exif_lock:
+            exif_tools, self._dead_exif_tools = self._dead_exif_tools, []
+        while True:
+            try:
+                exif_tools.append(self._exif_pool.get_nowait())
+            except queue.Empty:
+                break
+        for exif_tool in exif_tools:
+            if not exif_tool.running:
+                try:
+                    exif_tool = self.start_exif_tool()
+                except Exception as e:
+                    print(f"Could not restart ExifTool: {e}")
+            self._exif_pool.put(exif_tool)
+
+    @contextmanager
+    def borrow_exif_tool(self):
+        """
+        Lends a persistent ExifTool process to the calling thread, waiting for one if all are busy.
+        A process that died is set aside for refill_exif_pool and another one is lent instead.
+        Once none is left alive, RuntimeError is raised, and the dead process stays in the pool
+        so the threads waiting on it raise too instead of blocking.
+        """
+        while True:
+            if not self._exif_tools:
+                raise RuntimeError("ExifTool is not available")
+            exif_tool = self._exif_pool.get()
+            if exif_tool.running:
+                break
+            with self._exif_lock:
+                if exif_tool in self._exif_tools:
+                    self._exif_tools.remove(exif_tool)
+                if self._exif_tools:
+                    self._dead_exif_tools.append(exif_tool)
+                    continue
+            self._exif_pool.put(exif_tool)
+            raise RuntimeError("ExifTool process died")
+        try:
+            yield exif_tool
+        finally:
+            self._exif_pool.put(exif_tool)
+
+    def set_exif_tags(self, img_names, tags: dict, params: Iterable[str]):
+        """
+        Writes tags to one or more files through a persistent ExifTool process.
+        """
+        with self.borrow_exif_tool() as exif_tool:
+            return exif_tool.set_tags(img_names, tags=tags, params=params)
+
+    def close(self):
+        """
+        Shuts down the composite pool and the persistent ExifTool processes.
+        """
+        self._composite_executor.shutdown(wait=True)
+        self.flush_img_tags()
+        self.flush_log()
+        with self._exif_lock:
+            for exif_tool in self._exif_tools:
+                if exif_tool.running:
+                    exif_tool.terminate()
+            self._exif_tools.clear()
+
+    def log_pillow_build(self):
+        """
+        Logs which Pillow build is in use. Pillow-SIMD (version suffix .postN) speeds up
+        the resizing and alpha blending done for composites.
+        """
+        build = "Pillow-SIMD" if ".post" in PIL_VERSION else "Pillow"
+        turbo = "yes" if features.check_feature("libjpeg_turbo") else "no"
+        self.verbose_msg(f"Using {build} {PIL_VERSION} (libjpeg-turbo: {turbo})")
+
     @staticmethod
     def init_time_span(args: argparse.Namespace) -> tuple:
         """
@@ -199,7 +506,87 @@ class BeRealExporter:
         Uses logging to work nicely with progress bars.
         """
         if self.verbose and self.logger:
-            self.logger.info(msg)
+            self._log_queue.put(msg)
+
+    def flush_log(self):
+        """
+        Waits until the queued verbose messages have been written.
+        Does nothing while they are held back by hold_log, hold_log flushed them already.
+        """
+        if self.verbose and self.logger and self._log_open.is_set():
+            self._log_queue.join()
+
+    @contextmanager
+    def hold_log(self):
+        """
+        Writes out the queued verbose messages, then holds new ones back until the block ends,
+        so copies still running in the background don't print over an interactive prompt.
+        """
+        self.flush_log()
+        self._log_open.clear()
+        try:
+            yield
+        finally:
+            self._log_open.set()
+
+    def _write_log(self):
+        """
+        Logger thread, writes the queued verbose messages. Everything queued by the time
+        it gets to them is logged together, one terminal write per batch.
+        """
+        log_queue = self._log_queue
+        while True:
+            batch = [log_queue.get()]
+            try:
+                while True:
+                    batch.append(log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            self._log_open.wait()
+            try:
+                self.logger.info("\n".join(batch))
+            finally:
+                for _ in batch:
+                    log_queue.task_done()
+
+    def get_timezone_name(self, latitude: float, longitude: float):
+        """
+        Returns the timezone name for the given coordinates.
+        Lookups are cached on coordinates rounded to 2 decimals (about 1 km).
+        """
+        key = (round(latitude, 2), round(longitude, 2))
+        try:
+            return self._timezone_cache[key]
+        except KeyError:
+            pass
+
+        with self._timezone_lock:
+            if key not in self._timezone_cache:
+                if self._timezone_finder is None:
+                    self._timezone_finder = TimezoneFinder()
+                self._timezone_cache[key] = self._timezone_finder.timezone_at(lat=key[0], lng=key[1])
+            return self._timezone_cache[key]
+
+    def prime_timezone_cache(self, locations):
+        """
+        Looks up the timezone of every distinct location cell once, before the workers start,
+        so they only hit the cache instead of queuing on the lookup lock.
+        """
+        cells = set()
+        for location in locations:
+            if not location:
+                continue
+            latitude, longitude = location.get("latitude"), location.get("longitude")
+            # Null or malformed coordinates are left to convert_to_local_time, which falls back
+            # to the default timezone for that BeReal alone
+            if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+                cells.add((round(latitude, 2), round(longitude, 2)))
+        for latitude, longitude in cells:
+            try:
+                self.get_timezone_name(latitude, longitude)
+            except Exception as e:
+                self.verbose_msg(f"Error determining timezone for {latitude}, {longitude}: {e}")
+        self.verbose_msg(f"Resolved timezones for {len(cells)} distinct locations")
 
     def convert_to_local_time(self, utc_dt: dt, location=None) -> dt:
         """
@@ -207,23 +594,21 @@ class BeRealExporter:
         """
         # Ensure the datetime is timezone-aware (UTC)
         if utc_dt.tzinfo is None:
-            utc_dt = pytz.UTC.localize(utc_dt)
-        elif utc_dt.tzinfo != pytz.UTC:
-            utc_dt = utc_dt.astimezone(pytz.UTC)
+            utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+        elif utc_dt.tzinfo != timezone.utc:
+            utc_dt = utc_dt.astimezone(timezone.utc)
         
         # Default timezone
-        local_tz = pytz.timezone('America/New_York')
+        local_tz = DEFAULT_TIMEZONE
         
-        # Try to get timezone from location if available
-        if location and "latitude" in location and "longitude" in location:
+        # Try to get timezone from location if available, each coordinate is looked up once
+        latitude = location.get("latitude") if location else None
+        longitude = location.get("longitude") if location else None
+        if latitude is not None and longitude is not None:
             try:
-                tf = TimezoneFinder()
-                timezone_str = tf.timezone_at(
-                    lat=location["latitude"], 
-                    lng=location["longitude"]
-                )
+                timezone_str = self.get_timezone_name(latitude, longitude)
                 if timezone_str:
-                    local_tz = pytz.timezone(timezone_str)
+                    local_tz = ZoneInfo(timezone_str)
                     self.verbose_msg(f"Using timezone {timezone_str} from GPS location")
                 else:
                     self.verbose_msg("GPS location found but timezone lookup failed, using America/New_York")
@@ -236,15 +621,25 @@ class BeRealExporter:
         local_dt = utc_dt.astimezone(local_tz)
         return local_dt.replace(tzinfo=None)
 
-    def process_memory(self, memory, out_path_memories):
+    def submit_composite(self, primary_path: str, secondary_path: str, output_path: str, img_dt: dt, img_location=None, local_dt: dt = None):
         """
-        Processes a single memory (for parallel execution).
-        Saves to posts folder and skips if files already exist to avoid duplicates.
+        Queues a composite of the two source images on the composite pool.
+        Returns the future, or None if a source image can't be found.
         """
-        memory_dt = self.get_datetime_from_str(memory["takenTime"])
-        if not (self.time_span[0] <= memory_dt <= self.time_span[1]):
+        primary_src = self.resolve_img_path(primary_path)
+        secondary_src = self.resolve_img_path(secondary_path)
+        if not (primary_src and secondary_src):
             return None
+        return self._composite_executor.submit(
+            self.create_composite_image, primary_src, secondary_src, output_path, img_dt, img_location, local_dt
+        )
 
+    def process_memory(self, memory, memory_dt: dt, out_path_memories):
+        """
+        Processes a single memory (for parallel execution).
+        Saves to posts folder and skips if files already exist to avoid duplicates.
+        Existing files are looked up in the listing of the output folder instead of the disk.
+        """
         # Get front and back image paths
         front_path = os.path.join(self.bereal_path, memory["frontImage"]["path"])
         back_path = os.path.join(self.bereal_path, memory["backImage"]["path"])
@@ -254,36 +649,49 @@ class BeRealExporter:
         local_dt = self.convert_to_local_time(memory_dt, img_location)
         
         # Create output filenames with descriptive names
-        base_filename = f"{local_dt.strftime('%Y-%m-%d_%H-%M-%S')}"
-        secondary_output = f"{out_path_memories}/{base_filename}_selfie-view.webp"  # front camera
-        primary_output = f"{out_path_memories}/{base_filename}_main-view.webp"     # back camera
-        composite_output = f"{out_path_memories}/{base_filename}_composited.webp"
+        base_filename = self.format_filename_datetime(local_dt)
+        base_path = f"{out_path_memories}/{base_filename}"
+        secondary_output = base_path + "_selfie-view.webp"  # front camera
+        primary_output = base_path + "_main-view.webp"     # back camera
+        composite_output = base_path + "_composited.webp"
         
-        # Skip if files already exist (avoid duplicates from posts)
-        if os.path.exists(primary_output) and os.path.exists(secondary_output) and os.path.exists(composite_output):
+        # Skip if files already exist (avoid duplicates from posts). Memories with the same timestamp
+        # in this run are skipped like files from earlier runs, checked and claimed under one lock.
+        outputs = [os.path.normpath(path) for path in (primary_output, secondary_output, composite_output)]
+        with self._existing_files_lock:
+            existing_files = self._existing_files
+            has_primary, has_secondary, has_composite = (path in existing_files for path in outputs)
+            existing_files.update(outputs)
+        if has_primary and has_secondary and has_composite:
             self.verbose_msg(f"Skipping {base_filename} - already exists from posts export")
             return f"{base_filename} (skipped - duplicate)"
         
+        # Create composite image (back/primary as background, front/secondary as overlay - BeReal style).
+        # It's built from the source images on the composite pool, so the CPU-bound Pillow work
+        # overlaps with copying and tagging the individual images below.
+        composite_future = None
+        if not has_composite:
+            composite_future = self.submit_composite(
+                back_path, front_path, composite_output, memory_dt, img_location, local_dt
+            )
+        
         # Export individual images (front=secondary, back=primary)
-        if not os.path.exists(secondary_output):
-            self.export_img(front_path, secondary_output, memory_dt, img_location)
-        if not os.path.exists(primary_output):
-            self.export_img(back_path, primary_output, memory_dt, img_location)
+        imgs = []
+        if not has_secondary:
+            imgs.append((front_path, secondary_output))
+        if not has_primary:
+            imgs.append((back_path, primary_output))
+        self.export_imgs(imgs, memory_dt, img_location, local_dt)
         
-        # Create composite image (back/primary as background, front/secondary as overlay - BeReal style)
-        if not os.path.exists(composite_output) and os.path.exists(secondary_output) and os.path.exists(primary_output):
-            self.create_composite_image(primary_output, secondary_output, composite_output, memory_dt, img_location)
+        if composite_future:
+            composite_future.result()
 
         return base_filename
 
-    def process_post(self, post, out_path_posts):
+    def process_post(self, post, post_dt: dt, out_path_posts):
         """
         Processes a single post (for parallel execution).
         """
-        post_dt = self.get_datetime_from_str(post["takenAt"])
-        if not (self.time_span[0] <= post_dt <= self.time_span[1]):
-            return None
-
         # Get primary and secondary image paths
         primary_path = os.path.join(self.bereal_path, post["primary"]["path"])
         secondary_path = os.path.join(self.bereal_path, post["secondary"]["path"])
@@ -293,24 +701,45 @@ class BeRealExporter:
         local_dt = self.convert_to_local_time(post_dt, post_location)
         
         # Create output filename
-        base_filename = f"{local_dt.strftime('%Y-%m-%d_%H-%M-%S')}"
+        base_filename = self.format_filename_datetime(local_dt)
         
         # Export individual images
-        primary_output = f"{out_path_posts}/{base_filename}_main-view.webp"
-        secondary_output = f"{out_path_posts}/{base_filename}_selfie-view.webp"
-        composite_output = f"{out_path_posts}/{base_filename}_composited.webp"
+        base_path = f"{out_path_posts}/{base_filename}"
+        primary_output = base_path + "_main-view.webp"
+        secondary_output = base_path + "_selfie-view.webp"
+        composite_output = base_path + "_composited.webp"
         
 
         
-        # Export primary image
-        self.export_img(primary_path, primary_output, post_dt, post_location)
+        # Create composite image from the source images while the individual images are exported
+        composite_future = self.submit_composite(
+            primary_path, secondary_path, composite_output, post_dt, post_location, local_dt
+        )
         
-        # Export secondary image  
-        self.export_img(secondary_path, secondary_output, post_dt, post_location)
+        # Export primary and secondary images
+        self.export_imgs(
+            [(primary_path, primary_output), (secondary_path, secondary_output)], post_dt, post_location, local_dt
+        )
         
-        # Create composite image
-        if os.path.exists(primary_output) and os.path.exists(secondary_output):
-            self.create_composite_image(primary_output, secondary_output, composite_output, post_dt, post_location)
+        if composite_future:
+            composite_future.result()
+
+        return base_filename
+
+    def process_realmoji(self, realmoji, realmoji_dt: dt, out_path_realmojis):
+        """
+        Processes a single realmoji (for parallel execution).
+        """
+        # Convert to local time for filename (to match EXIF metadata)
+        local_dt = self.convert_to_local_time(realmoji_dt, None)
+
+        base_filename = self.format_filename_datetime(local_dt)
+        img_name = f"{out_path_realmojis}/{base_filename}.webp"
+        old_img_name = os.path.join(
+            self.bereal_path,
+            realmoji["media"]["path"],
+        )
+        self.export_img(old_img_name, img_name, realmoji_dt, None, local_dt)
 
         return base_filename
 
@@ -321,7 +750,8 @@ class BeRealExporter:
         """
         if len(exported_files) != 2:
             return exported_files[0], exported_files[1] if len(exported_files) > 1 else exported_files[0]
-        
+
+        self.flush_log()
         print(f"\n--- Conversation {conversation_id}, Message ID {file_id} ---")
         if progress_info:
             print(f"Progress: {progress_info}")
@@ -538,6 +968,7 @@ class BeRealExporter:
             html_path = f.name
         
         # Open in browser
+        self.flush_log()
         print(f"Opening web UI for conversation {conversation_id}, message {file_id}...")
         webbrowser.open('file://' + html_path)
         
@@ -685,17 +1116,43 @@ class BeRealExporter:
         return os.path.basename(image["path"])
 
     @staticmethod
+    def format_filename_datetime(local_dt: dt) -> str:
+        """
+        Formats a datetime for output filenames ("YYYY-MM-DD_HH-MM-SS").
+        Equivalent to strftime("%Y-%m-%d_%H-%M-%S"), without parsing the format on every call.
+        """
+        return (
+            f"{local_dt.year:04d}-{local_dt.month:02d}-{local_dt.day:02d}_"
+            f"{local_dt.hour:02d}-{local_dt.minute:02d}-{local_dt.second:02d}"
+        )
+
+    @staticmethod
+    def format_exif_datetime(local_dt: dt) -> str:
+        """
+        Formats a datetime the way EXIF expects it ("YYYY:MM:DD HH:MM:SS").
+        Equivalent to strftime("%Y:%m:%d %H:%M:%S"), without parsing the format on every call.
+        """
+        return (
+            f"{local_dt.year:04d}:{local_dt.month:02d}:{local_dt.day:02d} "
+            f"{local_dt.hour:02d}:{local_dt.minute:02d}:{local_dt.second:02d}"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
     def get_datetime_from_str(time: str) -> dt:
         """
         Returns a datetime object from a time key.
+        Cached, memories.json and posts.json hold the same BeReals with the same timestamps.
         """
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%fZ",  # With microseconds
-            "%Y-%m-%dT%H:%M:%S.000Z",  # Without microseconds
-            "%Y-%m-%dT%H:%M:%SZ"       # No milliseconds at all
-        ]
-        
-        for format_string in formats:
+        # BeReal timestamps are ISO 8601 in UTC ("2023-01-10T07:30:00.000Z"), fromisoformat
+        # parses those far faster than strptime. The formats below cover anything it rejects.
+        if isinstance(time, str) and time.endswith("Z"):
+            try:
+                return dt.fromisoformat(time[:-1])
+            except ValueError:
+                pass
+
+        for format_string in DATETIME_FORMATS:
             try:
                 return dt.strptime(time, format_string)
             except ValueError:
@@ -710,37 +1167,252 @@ class BeRealExporter:
             
         raise ValueError(f"Invalid datetime format: {time}")
 
+    def filter_by_time_span(self, items: Iterable[dict], time_key: str) -> list:
+        """
+        Returns (item, datetime) pairs for the items within the time span, sorted by time.
+        Timestamps are parsed at most once and items outside the span are dropped as they come in,
+        so only the selected items are held in memory when the items are streamed.
+        """
+        start, end = self.time_span
+        # ISO 8601 timestamps sort as strings, so the ones outside the span (to the second)
+        # are dropped by comparing their first 19 characters, without parsing them at all
+        start_str, end_str = start.isoformat()[:19], end.isoformat()[:19]
+        parse_time = self.get_datetime_from_str
+        get_time = itemgetter(time_key)
+        dated_items = []
+        add_item = dated_items.append
+        for item in items:
+            raw = get_time(item)
+            # Only standard "YYYY-MM-DDTHH:MM:SS...Z" timestamps can be compared as strings
+            if isinstance(raw, str) and raw[10:11] == "T" and raw[-1:] == "Z":
+                if not start_str <= raw[:19] <= end_str:
+                    continue
+            item_dt = parse_time(raw)
+            if start <= item_dt <= end:
+                add_item((item, item_dt))
+        dated_items.sort(key=itemgetter(1))
+        return dated_items
+
+    @staticmethod
+    def is_up_to_date(output_path: str, *source_paths: str) -> bool:
+        """
+        Returns True if the output file exists and is at least as new as all its sources.
+        """
+        try:
+            output_mtime = os.path.getmtime(output_path)
+            return all(output_mtime >= os.path.getmtime(source) for source in source_paths)
+        except OSError:
+            return False
+
+    def make_dirs(self, path: str):
+        """
+        Creates an output folder (and its parents) unless this run already did.
+        """
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def load_existing_exif(self, folder: str):
+        """
+        Reads DateTimeOriginal and the GPS position of all files already in an output folder with
+        a single ExifTool call, so re-runs can tell which exports are complete without asking
+        ExifTool file by file. Called from the main thread before each export, so it also
+        replaces ExifTool processes that died.
+        """
+        self.refill_exif_pool()
+        self._existing_exif = {}
+        self._existing_files = set()
+        if not os.path.isdir(folder):
+            return
+        files = [entry.path for entry in os.scandir(folder) if entry.is_file()]
+        if not files:
+            return
+        self._existing_files = {os.path.normpath(path) for path in files}
+
+        try:
+            with self.borrow_exif_tool() as exif_tool:
+                # -n gives the coordinates as numbers, their sign is in the Ref tags
+                results = exif_tool.get_tags(
+                    files,
+                    ["DateTimeOriginal", "GPSLatitude", "GPSLatitudeRef", "GPSLongitude", "GPSLongitudeRef"],
+                    params=["-fast2", "-n"],
+                )
+        except Exception as e:
+            self.verbose_msg(f"Could not read existing metadata in {folder}: {e}")
+            return
+
+        existing_exif = {}
+        for result in results:
+            values = {key.rpartition(":")[2]: value for key, value in result.items()}
+            if "DateTimeOriginal" not in values:
+                continue
+            try:
+                gps = (
+                    self.signed_coordinate(values["GPSLatitude"], values.get("GPSLatitudeRef"), "S"),
+                    self.signed_coordinate(values["GPSLongitude"], values.get("GPSLongitudeRef"), "W"),
+                )
+            except (KeyError, ValueError, TypeError):
+                gps = None
+            existing_exif[os.path.normpath(result["SourceFile"])] = (str(values["DateTimeOriginal"]), gps)
+        self._existing_exif = existing_exif
+        self.verbose_msg(f"Read existing metadata of {len(existing_exif)} files in {folder}")
+
+    @staticmethod
+    def signed_coordinate(value, ref, negative_ref: str) -> float:
+        """
+        Returns a coordinate read with -n as a signed number, using its Ref tag (N/S, E/W) if there is one.
+        """
+        value = float(value)
+        if not ref:
+            return value
+        return -abs(value) if str(ref).upper().startswith(negative_ref) else abs(value)
+
+    def has_exif_metadata(self, img_name: str, exif_dt: str, img_location=None) -> bool:
+        """
+        Returns True if the file had the given DateTimeOriginal and GPS position when its folder
+        was last scanned. Without a location any GPS position matches: tagging without one doesn't
+        remove it, and memories and posts of the same BeReal share the posts folder.
+        """
+        existing = self._existing_exif.get(os.path.normpath(img_name))
+        if existing is None or existing[0] != exif_dt:
+            return False
+        gps = existing[1]
+        if not img_location:
+            return True
+        return gps is not None and (
+            abs(gps[0] - img_location["latitude"]) <= GPS_MATCH_TOLERANCE
+            and abs(gps[1] - img_location["longitude"]) <= GPS_MATCH_TOLERANCE
+        )
+
+    def count_skipped(self):
+        """
+        Counts a file that was skipped because it is already up to date.
+        """
+        with self._skipped_lock:
+            self._skipped_count += 1
+
+    def resolve_img_path(self, img_path: str):
+        """
+        Returns the path of an existing source image, trying the fallback locations if needed.
+        """
+        if os.path.isfile(img_path):
+            return img_path
+        return self.find_fallback_img(img_path)
+
+    def find_fallback_img(self, old_img_name: str):
+        """
+        Looks for an image in the usual export locations, returns its path or None.
+        Candidates inside the Photos folders are checked against the folder index instead of the disk.
+        """
+        # Direct path from bereal_path
+        candidate = self.find_indexed_img(old_img_name.lstrip("/"))
+        if candidate:
+            return candidate
+
+        # Try with just the filename in the different Photos folders
+        filename = os.path.basename(old_img_name)
+        for paths in self._photo_index.values():
+            if filename in paths:
+                return paths[filename]
+
+        # Original fallback
+        return self.find_indexed_img(old_img_name)
+
+    def find_indexed_img(self, candidate: str):
+        """
+        Returns the path of a candidate relative to bereal_path if it exists, or None.
+        """
+        folder, name = os.path.split(candidate)
+        if folder in self._photo_index:
+            return self._photo_index[folder].get(name)
+        candidate = os.path.join(self.bereal_path, candidate)
+        return candidate if os.path.isfile(candidate) else None
+
     def export_img(
-        self, old_img_name: str, img_name: str, img_dt: dt, img_location=None
+        self, old_img_name: str, img_name: str, img_dt: dt, img_location=None, local_dt: dt = None
     ):
-        self.verbose_msg(f"Exporting {old_img_name} to {img_name}")
-        if img_location:
-            self.verbose_msg(f"Location data available: {img_location['latitude']}, {img_location['longitude']}")
-        else:
-            self.verbose_msg(f"No location data for {img_name}")
-
-        if not os.path.isfile(old_img_name):
-            # Try different fallback locations
-            fallback_locations = [
-                # Direct path from bereal_path
-                os.path.join(self.bereal_path, old_img_name.lstrip("/")),
-                # Try with just the filename in different folders
-                os.path.join(self.bereal_path, "Photos/post", os.path.basename(old_img_name)),
-                os.path.join(self.bereal_path, "Photos/bereal", os.path.basename(old_img_name)),
-                os.path.join(self.bereal_path, "Photos/realmoji", os.path.basename(old_img_name)),
-                # Original fallback
-                os.path.join(self.bereal_path, old_img_name)
-            ]
-            
-            for fallback in fallback_locations:
-                if os.path.isfile(fallback):
-                    old_img_name = fallback
-                    break
-            else:
-                print(f"File not found in expected locations: {old_img_name}")
+        self.export_imgs([(old_img_name, img_name)], img_dt, img_location, local_dt)
+
+    def export_imgs(self, imgs: list, img_dt: dt, img_location=None, local_dt: dt = None):
+        """
+        Exports images taken together (e.g. both sides of a BeReal) given as (source, destination) pairs.
+        Their tags are queued and written in batches, see queue_img_tags.
+        """
+        exported = []
+        for old_img_name, img_name in imgs:
+            copied = self.copy_img(old_img_name, img_name, img_dt, img_location, local_dt)
+            if copied:
+                exported.append((*copied, img_location))
+        if exported:
+            self.queue_img_tags(exported)
+
+    def queue_img_tags(self, exported: list):
+        """
+        Queues (image name, tags, local time, location) entries for tagging.
+        The queue is written with a single ExifTool command once it holds TAG_BATCH_SIZE images.
+        """
+        with self._tag_batch_lock:
+            self._tag_batch.extend(exported)
+            if len(self._tag_batch) < TAG_BATCH_SIZE:
                 return
+            batch, self._tag_batch = self._tag_batch, []
+        self.write_img_tags_batch(batch)
+
+    def flush_img_tags(self):
+        """
+        Writes the tags still waiting in the queue.
+        """
+        with self._tag_batch_lock:
+            batch, self._tag_batch = self._tag_batch, []
+        if batch:
+            self.write_img_tags_batch(batch)
+
+    def write_img_tags_batch(self, batch: list):
+        """
+        Writes different tags to many images with one ExifTool command, by importing them
+        from a JSON file (-json=) keyed by SourceFile. If that fails, every image goes
+        through the regular fallback chain on its own.
+        """
+        img_names = [img_name for img_name, _, _, _ in batch]
+        try:
+            with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+                json.dump([{"SourceFile": img_name, **tags} for img_name, tags, _, _ in batch], f)
+            try:
+                with self.borrow_exif_tool() as exif_tool:
+                    result = exif_tool.execute(f"-json={f.name}", *IMG_TAG_PARAMS, *img_names)
+            finally:
+                os.remove(f.name)
+            self.verbose_msg(f"ExifTool result: {result.strip()}")
+            self.verbose_msg(f"Metadata added to {len(img_names)} images")
+            return
+        except Exception as e:
+            self.verbose_msg(f"Batched metadata write failed for {len(img_names)} images ({e}), writing them one by one")
+        for img_name, tags, local_dt, img_location in batch:
+            self.write_img_tags(img_name, tags, local_dt, img_location)
 
-        os.makedirs(os.path.dirname(img_name), exist_ok=True)
+    def copy_img(
+        self, old_img_name: str, img_name: str, img_dt: dt, img_location=None, local_dt: dt = None
+    ):
+        """
+        Copies an image into the export and builds the tags it needs.
+        local_dt is img_dt in local time, computed here if the caller doesn't have it.
+        Returns (exported name, tags, local time), or None if there's nothing left to do.
+        """
+        # Only build the per-image messages when they will be shown
+        if self.verbose:
+            self.verbose_msg(f"Exporting {old_img_name} to {img_name}")
+            if img_location:
+                self.verbose_msg(f"Location data available: {img_location['latitude']}, {img_location['longitude']}")
+            else:
+                self.verbose_msg(f"No location data for {img_name}")
+
+        src_img_name = self.resolve_img_path(old_img_name)
+        if not src_img_name:
+            print(f"File not found in expected locations: {old_img_name}")
+            return
+        old_img_name = src_img_name
+
+        self.make_dirs(os.path.dirname(img_name))
         
         # Detect actual file format and adjust extension accordingly
         try:
@@ -759,110 +1431,73 @@ class BeRealExporter:
         except Exception as e:
             self.verbose_msg(f"Could not detect format for {old_img_name}: {e}, using original extension")
         
-        cp(old_img_name, img_name)
-
         # Convert to local time based on location
-        local_dt = self.convert_to_local_time(img_dt, img_location)
-        
-        # Use appropriate tags based on file format
-        if img_name.endswith('.jpg') or img_name.endswith('.jpeg'):
-            # JPEG supports full EXIF metadata
-            tags = {
-                "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-            }
-            if img_location:
-                self.verbose_msg(f"Adding GPS to JPEG {img_name}: {img_location['latitude']}, {img_location['longitude']}")
-                tags.update({
-                    "GPSLatitude": img_location["latitude"],
-                    "GPSLongitude": img_location["longitude"],
-                    "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                    "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                })
+        if local_dt is None:
+            local_dt = self.convert_to_local_time(img_dt, img_location)
+        exif_dt = self.format_exif_datetime(local_dt)
+
+        # Skip files exported by a previous run, only rewrite the metadata if it doesn't match
+        if self.is_up_to_date(img_name, old_img_name):
+            if self.has_exif_metadata(img_name, exif_dt, img_location):
+                self.count_skipped()
+                self.verbose_msg(f"Skipping {img_name} - up to date")
+                return
+            self.verbose_msg(f"{img_name} already copied, rewriting its metadata")
         else:
-            # WEBP has limited EXIF support, use minimal essential tags
-            tags = {
-                "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-            }
-            # Add GPS data if available (WEBP supports basic GPS)
-            if img_location:
-                self.verbose_msg(f"Adding GPS to WEBP {img_name}: {img_location['latitude']}, {img_location['longitude']}")
-                tags.update({
-                    "GPSLatitude": img_location["latitude"],
-                    "GPSLongitude": img_location["longitude"],
-                    "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                    "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                })
+            fast_copy(old_img_name, img_name)
+        
+        # Use appropriate tags based on file format: JPEG supports full EXIF metadata,
+        # WEBP has limited EXIF support and gets the minimal essential tags (basic GPS included)
+        is_jpeg = img_name.endswith(('.jpg', '.jpeg'))
+        if img_location and self.verbose:
+            self.verbose_msg(f"Adding GPS to {'JPEG' if is_jpeg else 'WEBP'} {img_name}: {img_location['latitude']}, {img_location['longitude']}")
+        tags = self.build_exif_tags(exif_dt, img_location, all_dates=is_jpeg)
+
+        return img_name, tags, local_dt
 
+    @staticmethod
+    def build_exif_tags(exif_dt: str, img_location=None, all_dates=True, gps_refs=True) -> dict:
+        """
+        Builds the tags written to an exported image: DateTimeOriginal, CreateDate and ModifyDate
+        (only DateTimeOriginal if not all_dates) and, with a location, the GPS position
+        (with its N/S and E/W references if gps_refs).
+        """
+        tags = {"DateTimeOriginal": exif_dt}
+        if all_dates:
+            tags["CreateDate"] = exif_dt
+            tags["ModifyDate"] = exif_dt
+        if img_location:
+            latitude, longitude = img_location["latitude"], img_location["longitude"]
+            tags["GPSLatitude"] = latitude
+            tags["GPSLongitude"] = longitude
+            if gps_refs:
+                tags["GPSLatitudeRef"] = "N" if latitude >= 0 else "S"
+                tags["GPSLongitudeRef"] = "E" if longitude >= 0 else "W"
+        return tags
+
+    def write_img_tags(self, img_name: str, tags: dict, local_dt: dt, img_location=None):
+        """
+        Writes tags to an exported image, falling back to fewer tags, a JPEG copy,
+        and finally the file modification time when ExifTool can't write them.
+        """
+        exif_dt = tags["DateTimeOriginal"]
         try:
-            with (
-                et(executable=self.exiftool_path) if self.exiftool_path else et()
-            ) as exif_tool:
-                result = exif_tool.set_tags(
-                    img_name, tags=tags, params=["-overwrite_original", "-m", "-q", "-overwrite_original_in_place"]
-                )
-                self.verbose_msg(f"ExifTool result: {result}")
-            self.verbose_msg(f"Metadata added to {img_name} (local time: {local_dt.strftime('%Y-%m-%d %H:%M:%S')})")
+            result = self.set_exif_tags(img_name, tags, IMG_TAG_PARAMS)
+            self.verbose_msg(f"ExifTool result: {result}")
+            self.verbose_msg(f"Metadata added to {img_name} (local time: {local_dt.isoformat(' ', 'seconds')})")
         except Exception as e:
             # WEBP files often have limited EXIF support, try with fewer tags
             self.verbose_msg(f"Primary metadata write failed for {img_name}, trying fallback approach")
             try:
                 # Try with just DateTimeOriginal which is more widely supported
-                fallback_tags = {"DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S")}
-                if img_location:
-                    fallback_tags.update({
-                        "GPSLatitude": img_location["latitude"],
-                        "GPSLongitude": img_location["longitude"],
-                        "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                        "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                    })
-                
-                with (
-                    et(executable=self.exiftool_path) if self.exiftool_path else et()
-                ) as exif_tool:
-                    result = exif_tool.set_tags(
-                        img_name, tags=fallback_tags, params=["-overwrite_original", "-m", "-q"]
-                    )
+                fallback_tags = self.build_exif_tags(exif_dt, img_location, all_dates=False)
+                result = self.set_exif_tags(img_name, fallback_tags, FALLBACK_TAG_PARAMS)
                 self.verbose_msg(f"Fallback metadata added to {img_name}")
             except Exception as e2:
                 print(f"WEBP metadata failed for {img_name}, trying JPEG conversion...")
                 # Convert to JPEG as final fallback for reliable EXIF
                 try:
-                    jpeg_name = img_name.replace('.webp', '.jpg')
-                    with Image.open(img_name) as img:
-                        # Convert to RGB if necessary (JPEG doesn't support transparency)
-                        if img.mode in ('RGBA', 'LA', 'P'):
-                            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                            if img.mode == 'P':
-                                img = img.convert('RGBA')
-                            rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                            img = rgb_img
-                        img.save(jpeg_name, 'JPEG', quality=95, optimize=True)
-                    
-                    # Add EXIF to JPEG (should work reliably)
-                    jpeg_tags = {
-                        "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                        "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                        "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-                    }
-                    if img_location:
-                        jpeg_tags.update({
-                            "GPSLatitude": img_location["latitude"],
-                            "GPSLongitude": img_location["longitude"],
-                            "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                            "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                        })
-                    
-                    with (
-                        et(executable=self.exiftool_path) if self.exiftool_path else et()
-                    ) as exif_tool:
-                        exif_tool.set_tags(
-                            jpeg_name, tags=jpeg_tags, params=["-overwrite_original"]
-                        )
-                    
-                    # Remove the original WEBP file since JPEG worked
-                    os.remove(img_name)
+                    jpeg_name = self.convert_to_tagged_jpeg(img_name, exif_dt, img_location)
                     self.verbose_msg(f"Converted to JPEG with full EXIF: {jpeg_name}")
                     
                 except Exception as e3:
@@ -875,10 +1510,40 @@ class BeRealExporter:
                     except Exception as e4:
                         print(f"Could not set any timestamp for {img_name}: {e4}")
 
+    def convert_to_tagged_jpeg(self, img_name: str, exif_dt: str, img_location=None) -> str:
+        """
+        Last resort when ExifTool can't tag an exported WEBP: converts it to JPEG, which takes
+        full EXIF reliably, tags the JPEG and removes the WEBP. Returns the JPEG's path.
+        """
+        jpeg_name = img_name.replace('.webp', '.jpg')
+        with Image.open(img_name) as img:
+            # Convert to RGB if necessary (JPEG doesn't support transparency)
+            if img.mode in ('RGBA', 'LA', 'P'):
+                rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                img = rgb_img
+            img.save(jpeg_name, 'JPEG', quality=95, optimize=True)
+
+        # Add full EXIF to JPEG
+        jpeg_tags = self.build_exif_tags(exif_dt, img_location)
+        self.set_exif_tags(jpeg_name, jpeg_tags, JPEG_TAG_PARAMS)
+
+        # Remove the original WEBP file since JPEG worked
+        if jpeg_name != img_name:
+            os.remove(img_name)
+        return jpeg_name
+
     def create_rounded_mask(self, size, radius):
         """
         Creates a rounded rectangle mask for the given size and radius with anti-aliasing.
+        Masks are cached per (size, radius) since BeReal images share a handful of sizes.
         """
+        mask = self._mask_cache.get((size, radius))
+        if mask is not None:
+            return mask
+
         # Use supersampling for smoother edges (4x resolution)
         scale = 4
         large_size = (size[0] * scale, size[1] * scale)
@@ -891,25 +1556,55 @@ class BeRealExporter:
         
         # Downsample with high-quality resampling for anti-aliasing
         mask = mask.resize(size, Image.Resampling.LANCZOS)
+        self._mask_cache[(size, radius)] = mask
         return mask
 
-    def create_composite_image(self, primary_path: str, secondary_path: str, output_path: str, img_dt: dt = None, img_location=None):
+    def create_composite_image(self, primary_path: str, secondary_path: str, output_path: str, img_dt: dt = None, img_location=None, local_dt: dt = None):
         """
         Creates a composite image with the secondary image overlaid on the primary image
         with padding from the top and left edges and rounded corners.
         Applies the same metadata as the source images.
+        local_dt is img_dt in local time, computed here if the caller doesn't have it.
         """
+        # JPEG primaries give a JPEG composite, which encodes much faster than WEBP
+        jpeg_output_path = os.path.splitext(output_path)[0] + ".jpg"
+
+        # Skip composites created by a previous run, unless their metadata doesn't match
+        exif_dt = None
+        if img_dt:
+            if local_dt is None:
+                local_dt = self.convert_to_local_time(img_dt, img_location)
+            exif_dt = self.format_exif_datetime(local_dt)
+        for existing_path in (output_path, jpeg_output_path):
+            if self.is_up_to_date(existing_path, primary_path, secondary_path):
+                if exif_dt is None or self.has_exif_metadata(existing_path, exif_dt, img_location):
+                    self.count_skipped()
+                    self.verbose_msg(f"Skipping composite {existing_path} - up to date")
+                else:
+                    # Only the metadata is off, no need to render the composite again
+                    self.verbose_msg(f"Composite {existing_path} already created, rewriting its metadata")
+                    self.write_composite_tags(existing_path, exif_dt, local_dt, img_location)
+                return
+
         try:
             # Open both images
             primary = Image.open(primary_path)
             secondary = Image.open(secondary_path)
+            if primary.format == "JPEG":
+                output_path = jpeg_output_path
             
             # Calculate secondary image size (about 1/4 of primary width)
             secondary_width = primary.width // 4
             secondary_height = int(secondary.height * (secondary_width / secondary.width))
             
-            # Resize secondary image
-            secondary_resized = secondary.resize((secondary_width, secondary_height), Image.Resampling.LANCZOS)
+            # Let JPEG sources decode at a reduced scale close to the target size (no-op for WEBP)
+            secondary.draft('RGB', (secondary_width, secondary_height))
+            
+            # Resize secondary image: box-reduce by an integer factor first, then a cheap bilinear pass.
+            # Close to LANCZOS quality for a ~4x downscale at a fraction of the cost.
+            secondary_resized = secondary.resize(
+                (secondary_width, secondary_height), Image.Resampling.BILINEAR, reducing_gap=2.0
+            )
             
             # Create rounded corners for the secondary image
             corner_radius = min(secondary_width, secondary_height) // 10  # 10% of the smaller dimension
@@ -932,224 +1627,84 @@ class BeRealExporter:
             inner_mask = self.create_rounded_mask((secondary_width, secondary_height), corner_radius)
             
             # Apply the mask to create rounded corners on the secondary image
-            secondary_with_alpha = Image.new('RGBA', (secondary_width, secondary_height), (0, 0, 0, 0))
-            secondary_rgba = secondary_resized.convert('RGBA')
-            secondary_with_alpha.paste(secondary_rgba, (0, 0))
+            secondary_with_alpha = secondary_resized.convert('RGBA')
             secondary_with_alpha.putalpha(inner_mask)
             
             # Paste the secondary image onto the bordered background
             bordered_image.paste(secondary_with_alpha, (border_width, border_width), secondary_with_alpha)
             
-            # Create a copy of the primary image and convert to RGBA for proper alpha blending
-            composite = primary.convert('RGBA')
+            # Paste straight onto an opaque RGB primary; only images with transparency
+            # need to be flattened onto white first
+            if primary.mode == 'RGB':
+                composite = primary
+            else:
+                primary_rgba = primary.convert('RGBA')
+                composite = Image.new('RGB', primary.size, (255, 255, 255))
+                composite.paste(primary_rgba, mask=primary_rgba.split()[-1])
             
             # Add padding (20 pixels from top and left)
             padding = 20
             
-            # Paste the bordered secondary image onto the primary with padding
+            # Paste the bordered secondary image onto the primary with padding,
+            # using its alpha channel as the mask
             composite.paste(bordered_image, (padding, padding), bordered_image)
             
-            # Convert back to RGB for saving as WEBP
-            final_composite = Image.new('RGB', composite.size, (255, 255, 255))
-            final_composite.paste(composite, mask=composite.split()[-1] if composite.mode == 'RGBA' else None)
-            
             # Save the composite image
-            final_composite.save(output_path, "WEBP", quality=95)
+            if output_path == jpeg_output_path:
+                composite.save(output_path, "JPEG", quality=95)
+            else:
+                # method=0 is the fastest WEBP encoder setting, at the same quality
+                composite.save(output_path, "WEBP", quality=95, method=0)
+            primary.close()
+            secondary.close()
             
             # Apply metadata to composite if datetime is provided
             if img_dt:
-                # Convert to local time based on location
-                local_dt = self.convert_to_local_time(img_dt, img_location)
-                
-                tags = {
-                    "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                    "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                    "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-                }
-                
-                if img_location:
-                    tags.update(
-                        {
-                            "GPSLatitude": img_location["latitude"],
-                            "GPSLongitude": img_location["longitude"],
-                            "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                            "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                        }
-                    )
-
-                try:
-                    with (
-                        et(executable=self.exiftool_path) if self.exiftool_path else et()
-                    ) as exif_tool:
-                        exif_tool.set_tags(
-                            output_path, tags=tags, params=["-P", "-overwrite_original", "-m"]
-                        )
-                    self.verbose_msg(f"Metadata added to composite: {output_path}")
-                except Exception as e:
-                    # Try fallback approach for composite
-                    try:
-                        fallback_tags = {"DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S")}
-                        if img_location:
-                            fallback_tags.update({
-                                "GPSLatitude": img_location["latitude"],
-                                "GPSLongitude": img_location["longitude"],
-                            })
-                        
-                        with (
-                            et(executable=self.exiftool_path) if self.exiftool_path else et()
-                        ) as exif_tool:
-                            exif_tool.set_tags(
-                                output_path, tags=fallback_tags, params=["-overwrite_original", "-m", "-q"]
-                            )
-                        self.verbose_msg(f"Fallback metadata added to composite: {output_path}")
-                    except Exception as e2:
-                        print(f"WEBP metadata failed for composite {output_path}, trying JPEG conversion...")
-                        # Convert composite to JPEG as fallback
-                        try:
-                            jpeg_path = output_path.replace('.webp', '.jpg')
-                            with Image.open(output_path) as img:
-                                if img.mode in ('RGBA', 'LA', 'P'):
-                                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                                    if img.mode == 'P':
-                                        img = img.convert('RGBA')
-                                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                                    img = rgb_img
-                                img.save(jpeg_path, 'JPEG', quality=95, optimize=True)
-                            
-                            # Add full EXIF to JPEG
-                            jpeg_tags = {
-                                "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                                "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                                "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-                            }
-                            if img_location:
-                                jpeg_tags.update({
-                                    "GPSLatitude": img_location["latitude"],
-                                    "GPSLongitude": img_location["longitude"],
-                                    "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                                    "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                                })
-                            
-                            with (
-                                et(executable=self.exiftool_path) if self.exiftool_path else et()
-                            ) as exif_tool:
-                                exif_tool.set_tags(
-                                    jpeg_path, tags=jpeg_tags, params=["-overwrite_original"]
-                                )
-                            
-                            os.remove(output_path)  # Remove WEBP since JPEG worked
-                            self.verbose_msg(f"Converted composite to JPEG with full EXIF: {jpeg_path}")
-                            
-                        except Exception as e3:
-                            # Set file modification time as absolute last resort
-                            try:
-                                timestamp = local_dt.timestamp()
-                                os.utime(output_path, (timestamp, timestamp))
-                                self.verbose_msg(f"Set file modification time for composite: {output_path}")
-                            except Exception:
-                                pass
+                self.write_composite_tags(output_path, exif_dt, local_dt, img_location)
             
             self.verbose_msg(f"Created composite image with rounded corners: {output_path}")
             
         except Exception as e:
             print(f"Error creating composite image: {e}")
             # Fallback to just copying the primary image WITH METADATA
-            cp(primary_path, output_path)
+            fast_copy(primary_path, output_path)
             
             # Apply metadata to fallback copy if datetime is provided
             if img_dt:
-                # Convert to local time based on location
-                local_dt = self.convert_to_local_time(img_dt, img_location)
-                
-                tags = {
-                    "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                    "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                    "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-                }
-                
-                if img_location:
-                    tags.update(
-                        {
-                            "GPSLatitude": img_location["latitude"],
-                            "GPSLongitude": img_location["longitude"],
-                            "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                            "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                        }
-                    )
+                self.write_composite_tags(output_path, exif_dt, local_dt, img_location, "fallback composite")
 
+    def write_composite_tags(self, output_path: str, exif_dt: str, local_dt: dt, img_location=None, kind="composite"):
+        """
+        Writes tags to a composite, falling back to fewer tags, a JPEG copy,
+        and finally the file modification time when ExifTool can't write them.
+        """
+        tags = self.build_exif_tags(exif_dt, img_location)
+        try:
+            self.set_exif_tags(output_path, tags, COMPOSITE_TAG_PARAMS)
+            self.verbose_msg(f"Metadata added to {kind}: {output_path}")
+        except Exception as e:
+            # Try fallback approach for composite
+            try:
+                fallback_tags = self.build_exif_tags(exif_dt, img_location, all_dates=False, gps_refs=False)
+                self.set_exif_tags(output_path, fallback_tags, FALLBACK_TAG_PARAMS)
+                self.verbose_msg(f"Fallback metadata added to {kind}: {output_path}")
+            except Exception as e2:
+                print(f"WEBP metadata failed for {kind} {output_path}, trying JPEG conversion...")
+                # Convert composite to JPEG as fallback
                 try:
-                    with (
-                        et(executable=self.exiftool_path) if self.exiftool_path else et()
-                    ) as exif_tool:
-                        exif_tool.set_tags(
-                            output_path, tags=tags, params=["-P", "-overwrite_original", "-m"]
-                        )
-                    self.verbose_msg(f"Metadata added to fallback composite: {output_path}")
-                except Exception as e:
-                    # Try fallback approach for fallback composite
+                    jpeg_path = self.convert_to_tagged_jpeg(output_path, exif_dt, img_location)
+                    self.verbose_msg(f"Converted {kind} to JPEG with full EXIF: {jpeg_path}")
+                    
+                except Exception as e3:
+                    # Set file modification time as absolute last resort
                     try:
-                        fallback_tags = {"DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S")}
-                        if img_location:
-                            fallback_tags.update({
-                                "GPSLatitude": img_location["latitude"],
-                                "GPSLongitude": img_location["longitude"],
-                            })
-                        
-                        with (
-                            et(executable=self.exiftool_path) if self.exiftool_path else et()
-                        ) as exif_tool:
-                            exif_tool.set_tags(
-                                output_path, tags=fallback_tags, params=["-overwrite_original", "-m", "-q"]
-                            )
-                        self.verbose_msg(f"Fallback metadata added to fallback composite: {output_path}")
-                    except Exception as e2:
-                        print(f"WEBP metadata failed for fallback composite {output_path}, trying JPEG conversion...")
-                        # Convert fallback composite to JPEG
-                        try:
-                            jpeg_path = output_path.replace('.webp', '.jpg')
-                            with Image.open(output_path) as img:
-                                if img.mode in ('RGBA', 'LA', 'P'):
-                                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                                    if img.mode == 'P':
-                                        img = img.convert('RGBA')
-                                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                                    img = rgb_img
-                                img.save(jpeg_path, 'JPEG', quality=95, optimize=True)
-                            
-                            # Add full EXIF to JPEG
-                            jpeg_tags = {
-                                "DateTimeOriginal": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                                "CreateDate": local_dt.strftime("%Y:%m:%d %H:%M:%S"),
-                                "ModifyDate": local_dt.strftime("%Y:%m:%d %H:%M:%S")
-                            }
-                            if img_location:
-                                jpeg_tags.update({
-                                    "GPSLatitude": img_location["latitude"],
-                                    "GPSLongitude": img_location["longitude"],
-                                    "GPSLatitudeRef": "N" if img_location["latitude"] >= 0 else "S",
-                                    "GPSLongitudeRef": "E" if img_location["longitude"] >= 0 else "W",
-                                })
-                            
-                            with (
-                                et(executable=self.exiftool_path) if self.exiftool_path else et()
-                            ) as exif_tool:
-                                exif_tool.set_tags(
-                                    jpeg_path, tags=jpeg_tags, params=["-overwrite_original"]
-                                )
-                            
-                            os.remove(output_path)  # Remove WEBP since JPEG worked
-                            self.verbose_msg(f"Converted fallback composite to JPEG with full EXIF: {jpeg_path}")
-                            
-                        except Exception as e3:
-                            # Set file modification time as absolute last resort
-                            try:
-                                timestamp = local_dt.timestamp()
-                                os.utime(output_path, (timestamp, timestamp))
-                                self.verbose_msg(f"Set file modification time for fallback composite: {output_path}")
-                            except Exception:
-                                pass
+                        timestamp = local_dt.timestamp()
+                        os.utime(output_path, (timestamp, timestamp))
+                        self.verbose_msg(f"Set file modification time for {kind}: {output_path}")
+                    except Exception:
+                        pass
 
-    def export_memories(self, memories: list):
+    def export_memories(self, memories: Iterable[dict]):
         """
         Exports all memories to the posts folder to avoid duplicates.
         
@@ -1163,83 +1718,103 @@ class BeRealExporter:
         Uses parallel processing for faster execution.
         """
         out_path_memories = os.path.join(self.out_path, "posts")  # Use posts folder
-        os.makedirs(out_path_memories, exist_ok=True)
+        self.make_dirs(out_path_memories)
 
-        # Filter memories within time span first
-        valid_memories = []
-        for memory in memories:
-            memory_dt = self.get_datetime_from_str(memory["takenTime"])
-            if self.time_span[0] <= memory_dt <= self.time_span[1]:
-                valid_memories.append(memory)
+        # Filter memories within time span first, keeping the parsed timestamp for the workers
+        valid_memories = self.filter_by_time_span(memories, "takenTime")
 
         if not valid_memories:
             self.verbose_msg("No memories found in the specified time range")
             return
 
+        self.prime_timezone_cache(memory.get("location") for memory, _ in valid_memories)
+
+        self.load_existing_exif(out_path_memories)
+        skipped_before = self._skipped_count
         self.verbose_msg(f"Processing {len(valid_memories)} memories with {self.max_workers} workers (saving to posts folder)...")
 
         # Process memories in parallel with progress bar
-        with logging_redirect_tqdm() if self.verbose else tqdm(disable=False):
+        with logging_redirect_tqdm() if self.verbose else nullcontext():
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
                 future_to_memory = {
-                    executor.submit(self.process_memory, memory, out_path_memories): i 
-                    for i, memory in enumerate(valid_memories, 1)
+                    executor.submit(self.process_memory, memory, memory_dt, out_path_memories): i
+                    for i, (memory, memory_dt) in enumerate(valid_memories, 1)
                 }
                 
                 # Process completed tasks with progress bar
                 with tqdm(total=len(valid_memories), desc="Exporting memories", unit="memory", 
-                         leave=True, position=0) as pbar:
+                         leave=True, position=0, mininterval=PROGRESS_MININTERVAL,
+                         miniters=max(1, len(valid_memories) // PROGRESS_STEPS), disable=None) as pbar:
                     for future in as_completed(future_to_memory):
                         memory_index = future_to_memory[future]
                         try:
                             result = future.result()
                             if result:
-                                pbar.set_postfix_str(f"Latest: {result}")
+                                pbar.set_postfix_str(f"Latest: {result}", refresh=False)
                             pbar.update(1)
                         except Exception as e:
                             tqdm.write(f"Error processing memory {memory_index}: {e}")
                             pbar.update(1)
 
+        self.flush_img_tags()
         self.verbose_msg(f"Completed exporting {len(valid_memories)} memories")
+        skipped = self._skipped_count - skipped_before
+        if skipped:
+            self.verbose_msg(f"Skipped {skipped} up-to-date files while exporting memories")
+        self.flush_log()
 
-    def export_realmojis(self, realmojis: list):
+    def export_realmojis(self, realmojis: Iterable[dict]):
         """
         Exports all realmojis from the Photos directory to the corresponding output folder.
+        Uses parallel processing for faster execution.
         """
         out_path_realmojis = os.path.join(self.out_path, "realmojis")
-        os.makedirs(out_path_realmojis, exist_ok=True)
+        self.make_dirs(out_path_realmojis)
 
-        # Filter realmojis within time span first
-        valid_realmojis = []
-        for realmoji in realmojis:
-            realmoji_dt = self.get_datetime_from_str(realmoji["postedAt"])
-            if self.time_span[0] <= realmoji_dt <= self.time_span[1]:
-                valid_realmojis.append((realmoji, realmoji_dt))
+        # Filter realmojis within time span first, keeping the parsed timestamp for the workers
+        valid_realmojis = self.filter_by_time_span(realmojis, "postedAt")
 
         if not valid_realmojis:
             self.verbose_msg("No realmojis found in the specified time range")
             return
 
-        # Process with progress bar
-        with logging_redirect_tqdm() if self.verbose else tqdm(disable=False):
-            with tqdm(valid_realmojis, desc="Exporting realmojis", unit="realmoji",
-                     leave=True, position=0) as pbar:
-                for realmoji, realmoji_dt in pbar:
-                    # Convert to local time for filename (to match EXIF metadata)
-                    local_dt = self.convert_to_local_time(realmoji_dt, None)
-                    
-                    img_name = (
-                        f"{out_path_realmojis}/{local_dt.strftime('%Y-%m-%d_%H-%M-%S')}.webp"
-                    )
-                    old_img_name = os.path.join(
-                        self.bereal_path,
-                        realmoji["media"]["path"],
-                    )
-                    self.export_img(old_img_name, img_name, realmoji_dt, None)
-                    pbar.set_postfix_str(f"Latest: {local_dt.strftime('%Y-%m-%d_%H-%M-%S')}")
-
-    def export_posts(self, posts: list):
+        self.load_existing_exif(out_path_realmojis)
+        skipped_before = self._skipped_count
+        self.verbose_msg(f"Processing {len(valid_realmojis)} realmojis with {self.max_workers} workers...")
+
+        # Process realmojis in parallel with progress bar
+        with logging_redirect_tqdm() if self.verbose else nullcontext():
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Submit all tasks
+                future_to_realmoji = {
+                    executor.submit(self.process_realmoji, realmoji, realmoji_dt, out_path_realmojis): i
+                    for i, (realmoji, realmoji_dt) in enumerate(valid_realmojis, 1)
+                }
+
+                # Process completed tasks with progress bar
+                with tqdm(total=len(valid_realmojis), desc="Exporting realmojis", unit="realmoji",
+                         leave=True, position=0, mininterval=PROGRESS_MININTERVAL,
+                         miniters=max(1, len(valid_realmojis) // PROGRESS_STEPS), disable=None) as pbar:
+                    for future in as_completed(future_to_realmoji):
+                        realmoji_index = future_to_realmoji[future]
+                        try:
+                            result = future.result()
+                            if result:
+                                pbar.set_postfix_str(f"Latest: {result}", refresh=False)
+                            pbar.update(1)
+                        except Exception as e:
+                            tqdm.write(f"Error processing realmoji {realmoji_index}: {e}")
+                            pbar.update(1)
+
+        self.flush_img_tags()
+        self.verbose_msg(f"Completed exporting {len(valid_realmojis)} realmojis")
+        skipped = self._skipped_count - skipped_before
+        if skipped:
+            self.verbose_msg(f"Skipped {skipped} up-to-date files while exporting realmojis")
+        self.flush_log()
+
+    def export_posts(self, posts: Iterable[dict]):
         """
         Exports all posts from the Photos directory to the corresponding output folder.
         
@@ -1253,45 +1828,51 @@ class BeRealExporter:
         Uses parallel processing for faster execution.
         """
         out_path_posts = os.path.join(self.out_path, "posts")
-        os.makedirs(out_path_posts, exist_ok=True)
+        self.make_dirs(out_path_posts)
 
-        # Filter posts within time span first
-        valid_posts = []
-        for post in posts:
-            post_dt = self.get_datetime_from_str(post["takenAt"])
-            if self.time_span[0] <= post_dt <= self.time_span[1]:
-                valid_posts.append(post)
+        # Filter posts within time span first, keeping the parsed timestamp for the workers
+        valid_posts = self.filter_by_time_span(posts, "takenAt")
 
         if not valid_posts:
             self.verbose_msg("No posts found in the specified time range")
             return
 
+        self.prime_timezone_cache(post.get("location") for post, _ in valid_posts)
+
+        self.load_existing_exif(out_path_posts)
+        skipped_before = self._skipped_count
         self.verbose_msg(f"Processing {len(valid_posts)} posts with {self.max_workers} workers...")
 
         # Process posts in parallel with progress bar
-        with logging_redirect_tqdm() if self.verbose else tqdm(disable=False):
+        with logging_redirect_tqdm() if self.verbose else nullcontext():
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
                 future_to_post = {
-                    executor.submit(self.process_post, post, out_path_posts): i 
-                    for i, post in enumerate(valid_posts, 1)
+                    executor.submit(self.process_post, post, post_dt, out_path_posts): i
+                    for i, (post, post_dt) in enumerate(valid_posts, 1)
                 }
                 
                 # Process completed tasks with progress bar
                 with tqdm(total=len(valid_posts), desc="Exporting posts", unit="post",
-                         leave=True, position=0) as pbar:
+                         leave=True, position=0, mininterval=PROGRESS_MININTERVAL,
+                         miniters=max(1, len(valid_posts) // PROGRESS_STEPS), disable=None) as pbar:
                     for future in as_completed(future_to_post):
                         post_index = future_to_post[future]
                         try:
                             result = future.result()
                             if result:
-                                pbar.set_postfix_str(f"Latest: {result}")
+                                pbar.set_postfix_str(f"Latest: {result}", refresh=False)
                             pbar.update(1)
                         except Exception as e:
                             tqdm.write(f"Error processing post {post_index}: {e}")
                             pbar.update(1)
 
+        self.flush_img_tags()
         self.verbose_msg(f"Completed exporting {len(valid_posts)} posts")
+        skipped = self._skipped_count - skipped_before
+        if skipped:
+            self.verbose_msg(f"Skipped {skipped} up-to-date files while exporting posts")
+        self.flush_log()
 
     def export_conversations(self):
         """
@@ -1304,7 +1885,7 @@ class BeRealExporter:
             return
 
         out_path_conversations = os.path.join(self.out_path, "conversations")
-        os.makedirs(out_path_conversations, exist_ok=True)
+        self.make_dirs(out_path_conversations)
 
         # Get all conversation folders
         conversation_folders = [f for f in os.listdir(conversations_path) 
@@ -1322,7 +1903,7 @@ class BeRealExporter:
                 for image_file in image_files:
                     filename = os.path.basename(image_file)
                     try:
-                        file_id = filename.split('-')[0]
+                        file_id = filename.partition('-')[0]
                         if file_id not in temp_groups:
                             temp_groups[file_id] = []
                         temp_groups[file_id].append(image_file)
@@ -1334,10 +1915,10 @@ class BeRealExporter:
                     if len(files) == 2:
                         total_interactive_pairs += 1
 
-        with logging_redirect_tqdm() if self.verbose else tqdm(disable=False):
+        with logging_redirect_tqdm() if self.verbose else nullcontext():
             # Create main progress bar
             main_pbar = tqdm(conversation_folders, desc="Exporting conversations", unit="conversation",
-                           leave=True, position=0)
+                           leave=True, position=0, mininterval=PROGRESS_MININTERVAL, disable=None)
             
             # Create interactive progress bar if needed
             if self.interactive_conversations and total_interactive_pairs > 0:
@@ -1349,10 +1930,13 @@ class BeRealExporter:
                 interactive_pbar = None
                 interactive_count = 0
             
-            for conversation_id in main_pbar:
+            span_start, span_end = self.time_span
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for conversation_id in main_pbar:
                     conversation_folder = os.path.join(conversations_path, conversation_id)
                     out_conversation_folder = os.path.join(out_path_conversations, conversation_id)
-                    os.makedirs(out_conversation_folder, exist_ok=True)
+                    self.make_dirs(out_conversation_folder)
+                    self.load_existing_exif(out_conversation_folder)
 
                     # Get all image files in the conversation
                     image_files = glob.glob(os.path.join(conversation_folder, "*.webp"))
@@ -1363,8 +1947,8 @@ class BeRealExporter:
                     chat_log_by_id = {}
                     if os.path.exists(chat_log_path):
                         try:
-                            with open(chat_log_path, 'r', encoding='utf-8') as f:
-                                chat_log_data = json.load(f)
+                            with open(chat_log_path, 'rb') as f:
+                                chat_log_data = load_json(f)
                                 self.verbose_msg(f"Chat log structure: {type(chat_log_data)}")
                                 
                                 # Handle the actual structure: {"conversationId": "...", "messages": [{"id": "7", "userId": "...", "createdAt": "..."}]}
@@ -1388,7 +1972,7 @@ class BeRealExporter:
                                 
                                 self.verbose_msg(f"Loaded {len(chat_log_by_id)} chat log entries")
                                 if chat_log_by_id:
-                                    sample_key = list(chat_log_by_id.keys())[0]
+                                    sample_key = next(iter(chat_log_by_id))
                                     self.verbose_msg(f"Sample entry: ID {sample_key} (type: {type(sample_key)}) -> {chat_log_by_id[sample_key]}")
                                     self.verbose_msg(f"All chat log IDs: {list(chat_log_by_id.keys())}")  # Show all IDs
                                     
@@ -1403,7 +1987,7 @@ class BeRealExporter:
                         filename = os.path.basename(image_file)
                         try:
                             # Extract ID from filename like "7-gchAVq_kc0wAbj_tMMC3D.webp" -> "7"
-                            file_id = filename.split('-')[0]
+                            file_id = filename.partition('-')[0]
                             if file_id not in image_groups:
                                 image_groups[file_id] = []
                             image_groups[file_id].append(image_file)
@@ -1424,15 +2008,18 @@ class BeRealExporter:
                     for file_id, files in image_groups.items():
                         self.verbose_msg(f"  Group {file_id}: {len(files)} files - {[os.path.basename(f) for f in files]}")
 
-                    # Process each group
+                    # Process each group. The images of all groups are copied and tagged on the pool first,
+                    # composites (and interactive selections) follow on this thread as each group finishes.
+                    group_exports = []
                     for file_id, group_files in image_groups.items():
                         # Try to extract timestamp and user info from chat log using the file ID
                         img_dt = None
                         user_id = None
                         
                         try:
-                            self.verbose_msg(f"Looking for ID '{file_id}' (type: {type(file_id)}) in chat log...")
-                            self.verbose_msg(f"Available IDs in chat log: {list(chat_log_by_id.keys()) if len(chat_log_by_id) < 20 else list(chat_log_by_id.keys())[:20]}")
+                            if self.verbose:
+                                self.verbose_msg(f"Looking for ID '{file_id}' (type: {type(file_id)}) in chat log...")
+                                self.verbose_msg(f"Available IDs in chat log: {list(islice(chat_log_by_id, 20))}")
                             
                             # Try different ID formats (string vs int)
                             found_entry = None
@@ -1456,32 +2043,53 @@ class BeRealExporter:
                             img_dt = dt.fromtimestamp(os.path.getmtime(group_files[0]))
                             self.verbose_msg(f"✗ Error parsing chat log for ID {file_id}: {e}, using file modification time")
 
-                        # Check if within time span
-                        if not (self.time_span[0] <= img_dt <= self.time_span[1]):
+                        # Check if within time span, pairs outside of it won't need a selection
+                        if not (span_start <= img_dt <= span_end):
+                            if interactive_pbar and len(group_files) == 2:
+                                total_interactive_pairs -= 1
+                                interactive_pbar.total = total_interactive_pairs
+                                interactive_pbar.refresh()
                             continue
 
                         # Convert to local time for filename (to match EXIF metadata)
                         local_dt = self.convert_to_local_time(img_dt, None)
+                        timestamp_str = self.format_filename_datetime(local_dt)
+                        # Include user ID in filename if available
+                        user_suffix = f"_user_{user_id[:8]}" if user_id and user_id != 'unknown' else ""
+                        # All output names of the group start with the same path
+                        base_path = os.path.join(out_conversation_folder, f"{timestamp_str}_id{file_id}")
                         
                         # Export individual images with user info
-                        exported_files = []
+                        output_paths = []
+                        export_futures = []
                         for i, image_file in enumerate(group_files):
                             filename = os.path.basename(image_file)
-                            # Include user ID in filename if available
-                            user_suffix = f"_user_{user_id[:8]}" if user_id and user_id != 'unknown' else ""
                             base_name = os.path.splitext(filename)[0]
-                            output_filename = f"{local_dt.strftime('%Y-%m-%d_%H-%M-%S')}_id{file_id}_{i+1}{user_suffix}_{base_name}.webp"
-                            output_path = os.path.join(out_conversation_folder, output_filename)
+                            output_path = f"{base_path}_{i+1}{user_suffix}_{base_name}.webp"
                             
-                            self.export_img(image_file, output_path, img_dt, None)
+                            output_paths.append(output_path)
+                            export_futures.append(executor.submit(self.export_img, image_file, output_path, img_dt, None, local_dt))
+                        group_exports.append(
+                            (file_id, group_files, img_dt, local_dt, user_id, base_path, user_suffix, output_paths, export_futures)
+                        )
+
+                    for (file_id, group_files, img_dt, local_dt, user_id, base_path, user_suffix,
+                         output_paths, export_futures) in group_exports:
+                        # Sources of the images that were exported. The selection and the composite read
+                        # these rather than the copies, which may still be getting tagged in place by a
+                        # worker, and it keeps composites newer than their sources for re-runs.
+                        exported_files = []
+                        for image_file, output_path, future in zip(group_files, output_paths, export_futures):
+                            try:
+                                future.result()
+                            except Exception as e:
+                                tqdm.write(f"Error exporting {output_path}: {e}")
                             if os.path.exists(output_path):
-                                exported_files.append(output_path)
+                                exported_files.append(image_file)
 
                         # Create composite if we have exactly 2 images
                         if len(exported_files) == 2:
-                            user_suffix = f"_user_{user_id[:8]}" if user_id and user_id != 'unknown' else ""
-                            composite_filename = f"{local_dt.strftime('%Y-%m-%d_%H-%M-%S')}_id{file_id}{user_suffix}_composited.webp"
-                            composite_path = os.path.join(out_conversation_folder, composite_filename)
+                            composite_path = f"{base_path}{user_suffix}_composited.webp"
                             
                             # Choose detection method based on interactive mode
                             if self.web_ui and self.interactive_conversations:
@@ -1492,12 +2100,14 @@ class BeRealExporter:
                                 # Create progress info
                                 progress_info = f"Interactive pair {interactive_count + 1} of {total_interactive_pairs}" if interactive_pbar else None
                                 
-                                primary_img, overlay_img = self.web_ui_choose_primary_overlay(
-                                    exported_files, conversation_id, file_id, progress_info
-                                )
+                                with self.hold_log():
+                                    primary_img, overlay_img = self.web_ui_choose_primary_overlay(
+                                        exported_files, conversation_id, file_id, progress_info
+                                    )
                                 
                                 # Update progress after selection
                                 if interactive_pbar:
+                                    interactive_count += 1
                                     interactive_pbar.update(1)
                                     interactive_pbar.set_description("Interactive selections")
                                     
@@ -1509,12 +2119,14 @@ class BeRealExporter:
                                 # Create progress info
                                 progress_info = f"Interactive pair {interactive_count + 1} of {total_interactive_pairs}" if interactive_pbar else None
                                 
-                                primary_img, overlay_img = self.interactive_choose_primary_overlay(
-                                    group_files, exported_files, conversation_id, file_id, progress_info
-                                )
+                                with self.hold_log():
+                                    primary_img, overlay_img = self.interactive_choose_primary_overlay(
+                                        group_files, exported_files, conversation_id, file_id, progress_info
+                                    )
                                 
                                 # Update progress after selection
                                 if interactive_pbar:
+                                    interactive_count += 1
                                     interactive_pbar.update(1)
                                     interactive_pbar.set_description("Interactive selections")
                                     
@@ -1523,17 +2135,20 @@ class BeRealExporter:
                             
                             # Create composite if user didn't skip
                             if primary_img and overlay_img:
-                                self.create_composite_image(primary_img, overlay_img, composite_path, img_dt, None)
+                                self.create_composite_image(primary_img, overlay_img, composite_path, img_dt, None, local_dt)
                                 self.verbose_msg(f"Created composite for conversation ID {file_id} by user {user_id[:8] if user_id else 'unknown'}")
                             else:
                                 self.verbose_msg(f"Skipped composite for conversation ID {file_id}")
 
-                    main_pbar.set_postfix_str(f"Latest: {conversation_id}")
+                    main_pbar.set_postfix_str(f"Latest: {conversation_id}", refresh=False)
                     self.verbose_msg(f"Exported conversation: {conversation_id}")
-            
+
+            self.flush_img_tags()
+
             # Close interactive progress bar
             if interactive_pbar:
                 interactive_pbar.close()
+            self.flush_log()
 
 
 if __name__ == "__main__":
@@ -1546,41 +2161,41 @@ if __name__ == "__main__":
         print(f"Error: {e}")
         exit(1)
 
-    if args.memories:
-        try:
-            memories_path = os.path.join(exporter.bereal_path, "memories.json")
-            if os.path.exists(memories_path):
-                with open(memories_path, encoding="utf-8") as f:
-                    memories = json.load(f)
-                    exporter.export_memories(memories)
-            else:
-                print("memories.json file not found, skipping memories export.")
-        except json.JSONDecodeError:
-            print("Error decoding memories.json file.")
-
-    if args.posts:
-        try:
-            posts_path = os.path.join(exporter.bereal_path, "posts.json")
-            if os.path.exists(posts_path):
-                with open(posts_path, encoding="utf-8") as f:
-                    posts = json.load(f)
-                    exporter.export_posts(posts)
-            else:
-                print("posts.json file not found, skipping posts export.")
-        except json.JSONDecodeError:
-            print("Error decoding posts.json file.")
+    try:
+        if args.memories:
+            try:
+                memories_path = os.path.join(exporter.bereal_path, "memories.json")
+                if os.path.exists(memories_path):
+                    with open(memories_path, "rb") as f:
+                        exporter.export_memories(iter_json_items(f))
+                else:
+                    print("memories.json file not found, skipping memories export.")
+            except JSON_ERRORS:
+                print("Error decoding memories.json file.")
 
-    if args.realmojis:
-        try:
-            realmojis_path = os.path.join(exporter.bereal_path, "realmojis.json")
-            if os.path.exists(realmojis_path):
-                with open(realmojis_path, encoding="utf-8") as f:
-                    realmojis = json.load(f)
-                    exporter.export_realmojis(realmojis)
-            else:
-                print("realmojis.json file not found, skipping realmojis export.")
-        except json.JSONDecodeError:
-            print("Error decoding realmojis.json file.")
+        if args.posts:
+            try:
+                posts_path = os.path.join(exporter.bereal_path, "posts.json")
+                if os.path.exists(posts_path):
+                    with open(posts_path, "rb") as f:
+                        exporter.export_posts(iter_json_items(f))
+                else:
+                    print("posts.json file not found, skipping posts export.")
+            except JSON_ERRORS:
+                print("Error decoding posts.json file.")
 
-    if args.conversations:
-        exporter.export_conversations()
+        if args.realmojis:
+            try:
+                realmojis_path = os.path.join(exporter.bereal_path, "realmojis.json")
+                if os.path.exists(realmojis_path):
+                    with open(realmojis_path, "rb") as f:
+                        exporter.export_realmojis(iter_json_items(f))
+                else:
+                    print("realmojis.json file not found, skipping realmojis export.")
+            except JSON_ERRORS:
+                print("Error decoding realmojis.json file.")
+
+        if args.conversations:
+            exporter.export_conversations()
+    finally:
+        exporter.close()